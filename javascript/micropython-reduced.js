@@ -51,6 +51,16 @@ function string_transport(handle, string) {
   }
 }
 
+function data_transport(data) {
+  const fat_pointer = Module.rust_instance.exports.data_transport(data.length)
+  const pointer = Number(fat_pointer >> BigInt(32))
+
+  const memory = new Uint8Array(Module.rust_instance.exports.memory.buffer)
+  for(let i = 0; i < data.length; ++i) {
+    memory[pointer + i] = data[i]
+  }
+}
+
 function serialize() {
   const fat_pointer =  Module.rust_instance.exports.serialize()
   const offset = Number(fat_pointer >> BigInt(32))
@@ -72,6 +82,7 @@ export let proxy_js_ref = [{
   
   // Real functions
   string_transport,
+  data_transport,
   py_rust_call,
 }]
 
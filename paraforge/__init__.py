@@ -7,7 +7,9 @@ except ImportError:
 if micropython:
     import js
 else:
-    import os, ctypes
+    import os, ctypes, hashlib, threading
+
+import math, struct
 
 class ErrorCode:
     None_ = 0
@@ -30,35 +32,300 @@ class ErrorCode:
     SizeOutOfBounds = 17
     UnicodeError = 18
 
+# Error names indexed by code, frozen as a tuple so the raise path in
+# wasm_call is a bounds check + index instead of a try/except (CPython's
+# try-frame setup costs even when nothing raises)
+_ERROR_NAMES = ['']*(1 + max(value for value in ErrorCode.__dict__.values()
+    if isinstance(value, int)))
+for _name, _value in ErrorCode.__dict__.items():
+    if isinstance(_value, int): _ERROR_NAMES[_value] = _name
+_ERROR_NAMES = tuple(_ERROR_NAMES)
+
 class ParaforgeError(Exception):
-    def __init__(self, code: ErrorCode):
-        super().__init__(f'Code {code.value}: {code.name}')
+    def __init__(self, code: int):
+        self.code = code
+        if not 0 <= code < len(_ERROR_NAMES):
+            code = ErrorCode.UnrecognizedErrorCode
+        super().__init__(f'Code {self.code}: {_ERROR_NAMES[code]}')
 
 if not micropython:
-    store = wasmtime.Store()
+    # Deferred so that `import paraforge` (e.g. for ErrorCode alone) doesn't
+    # pay for compilation and instantiation. _load() runs on the first
+    # wasm_call cache miss, which every call path goes through
+    store = None
+    _exports = {}
+    _load_lock = threading.Lock()
+
+def _load():
+    global store, module, instance, _instance_exports, _memory
+    
+    with _load_lock:
+        if store is not None:
+            return
+        _load_locked()
+
+def _load_locked():
+    global store, module, instance, _instance_exports, _memory
+    
+    local_store = wasmtime.Store()
+    
+    # A precompiled artifact shipped next to paraforge.wasm (produced by a
+    # build step with engine.precompile_module) wins over both compiling
+    # and the per-user cache below
+    _cwasm_path = f'{os.path.dirname(__file__)}/paraforge.cwasm'
+    if os.path.exists(_cwasm_path):
+        try:
+            module = wasmtime.Module.deserialize_file(local_store.engine,
+                _cwasm_path)
+        except wasmtime.WasmtimeError:
+            # Serialized by a different wasmtime version than the one now
+            # installed - fall through to compiling paraforge.wasm. The
+            # per-user cache below keys on the version, so it can't mismatch
+            module = None
+        if module is not None:
+            instance = wasmtime.Instance(local_store, module, [])
+            _instance_exports = instance.exports(local_store)
+            _memory = _instance_exports['memory']
+            store = local_store
+            return
+    
     with open(f'{os.path.dirname(__file__)}/paraforge.wasm', 'rb') as f:
-        module = wasmtime.Module(store.engine, f.read())
-    instance = wasmtime.Instance(store, module, [])
+        _wasm_bytes = f.read()
+    
+    # Cranelift-compiling the module dominates import time, so the compiled
+    # artifact is cached keyed on the wasm bytes + wasmtime version and
+    # repeat imports deserialize it instead of recompiling
+    import importlib.metadata
+    _cache_key = hashlib.sha256(_wasm_bytes
+        + bytes(importlib.metadata.version('wasmtime'), 'utf8')).hexdigest()
+    _cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'paraforge')
+    _cache_path = os.path.join(_cache_dir, _cache_key + '.cwasm')
+    
+    if os.path.exists(_cache_path):
+        module = wasmtime.Module.deserialize_file(local_store.engine, _cache_path)
+    else:
+        module = wasmtime.Module(local_store.engine, _wasm_bytes)
+        try:
+            # Written to a temp name then renamed, so a half-written cache
+            # file is never visible to a concurrent import
+            os.makedirs(_cache_dir, exist_ok=True)
+            _temp_path = f'{_cache_path}.{os.getpid()}'
+            with open(_temp_path, 'wb') as f:
+                f.write(module.serialize())
+            os.replace(_temp_path, _cache_path)
+        except OSError:
+            # The cache is purely an optimization - a read-only home
+            # directory just means recompiling next import
+            pass
+    
+    instance = wasmtime.Instance(local_store, module, [])
+    # Resolved export callables, populated lazily from a single exports
+    # snapshot. instance.exports(store) rebuilds its whole dict on every
+    # access, which is pure overhead when wasm_call runs thousands of times
+    # per model
+    _instance_exports = instance.exports(local_store)
+    _memory = _instance_exports['memory']
+    # Published last: wasm_call treats a non-None store as fully loaded
+    store = local_store
 
 
+def _typed_caller(fn):
+    # wasmtime's Func.__call__ re-queries the function's type on every
+    # invocation and rebuilds its parameter metadata from scratch. All of
+    # that is fixed per export, so it's captured here once and the remaining
+    # per-call work is just the argument conversion and the raw call. Falls
+    # back to the stock callable if the internals ever change shape
+    try:
+        _is_f64 = tuple(t == wasmtime.ValType.f64()
+            for t in fn.type(store).params)
+    except Exception:
+        return fn
+    
+    try:
+        from ctypes import byref
+        from wasmtime import _ffi
+        from wasmtime._func import enter_wasm
+        
+        ty = fn.type(store)
+        param_tys = ty.params
+        param_count = len(param_tys)
+        result_count = len(ty.results)
+        params_type = _ffi.wasmtime_val_t*param_count
+        results_type = _ffi.wasmtime_val_t*result_count
+        raw_func = fn._func
+        convert = wasmtime.Val._convert_to_raw
+        from_raw = wasmtime.Val._from_raw
+        func_call = _ffi.wasmtime_func_call
+        unroot = _ffi.wasmtime_val_unroot
+        
+        # Per-parameter converters resolved once from the signature. The f64
+        # one calls float() itself, so callers don't need to pre-coerce ints
+        # (wasmtime's generic conversion rejects int-for-f64) and already-
+        # float arguments skip the isinstance chain entirely
+        _val = wasmtime.Val
+        converters = []
+        for param_ty in param_tys:
+            if param_ty == wasmtime.ValType.f64():
+                converters.append(
+                    lambda store, v: _val.f64(float(v))._new_raw(store))
+            elif param_ty == wasmtime.ValType.i32():
+                converters.append(
+                    lambda store, v: _val.i32(v)._new_raw(store))
+            elif param_ty == wasmtime.ValType.i64():
+                converters.append(
+                    lambda store, v: _val.i64(v)._new_raw(store))
+            else:
+                converters.append(
+                    lambda store, v, _ty=param_ty: convert(store, _ty, v))
+    except Exception:
+        # The stock callable rejects int-for-f64 and the wrappers no longer
+        # pre-coerce, so the fallback has to keep that part of the contract
+        def call(store, *params):
+            return fn(store, *[float(v) if f else v
+                for f, v in zip(_is_f64, params)])
+        return call
+    
+    def call(store, *params):
+        if len(params) != param_count:
+            raise TypeError(f'expected {param_count} parameters, '
+                f'got {len(params)}')
+        
+        params_ptr = params_type()
+        for i in range(param_count):
+            params_ptr[i] = converters[i](store, params[i])
+        results_ptr = results_type()
+        
+        with enter_wasm(store) as trap:
+            error = func_call(store._context(), byref(raw_func), params_ptr,
+                param_count, results_ptr, result_count, trap)
+            if error:
+                raise wasmtime.WasmtimeError._from_ptr(error)
+        
+        for i in range(param_count):
+            unroot(byref(params_ptr[i]))
+        
+        if result_count == 1:
+            return from_raw(store, results_ptr[0]).value
+        return None
+    
+    return call
+
+# Pre-compiled packers for the fixed record formats used on hot paths;
+# struct.pack/unpack with a literal format re-parses the format string (or
+# at best hits the format cache) on every call
+_PACK_VERTEX = struct.Struct('<3d').pack
+_PACK_TRIANGLE = struct.Struct('<3I').pack
+_PACK_CUBE = struct.Struct('<6d').pack
+_PACK_OP = struct.Struct('<I4x6d').pack
+_PACK_MOVE = struct.Struct('<I4x3d').pack
+_UNPACK_SHORT_STRING = struct.Struct('<II').unpack
+
+_half_angle_cache = {}
+
+def _half_angle(v: float):
+    # Node rotations are almost always the same few multiples of pi/2, so
+    # the half-angle cos/sin pair for each distinct angle is computed once
+    # and then served with a single dict lookup
+    result = _half_angle_cache.get(v)
+    if result is None:
+        result = _half_angle_cache[v] = (math.cos(0.5*v), math.sin(0.5*v))
+    return result
+
 class Node:
+    __slots__ = ('_name', '_handle', '_tx', '_ty', '_tz', '_rotation',
+        '_sx', '_sy', '_sz')
+    
     @property
     def name(self): return self._name
     @property
     def handle(self): return self._handle
+    @property
+    def translation(self): return (self._tx, self._ty, self._tz)
+    @property
+    def rotation(self): return self._rotation
+    @property
+    def scale(self): return (self._sx, self._sy, self._sz)
     
     def __init__(self, name: str = ''):
         assert len(name) <= 64
         
         self._name = name
         
+        self._tx = self._ty = self._tz = 0.0
+        self._rotation = (0.0, 0.0, 0.0, 1.0)
+        self._sx = self._sy = self._sz = 1.0
+        
         self._handle = add_node_to_scene(0, self._name)
     
     def add_mesh(self, name: str = ''):
         return Mesh(self, name)
+    
+    def t(self, x: int | float, y: int | float, z: int | float) -> 'Node':
+        self._tx += x
+        self._ty += y
+        self._tz += z
+        node_set_translation(self._handle, self._tx, self._ty, self._tz)
+        return self
+    
+    def s(self, x: int | float, y: int | float, z: int | float) -> 'Node':
+        self._sx *= x
+        self._sy *= y
+        self._sz *= z
+        node_set_scale(self._handle, self._sx, self._sy, self._sz)
+        return self
+    
+    def r(self, x: int | float, y: int | float, z: int | float) -> 'Node':
+        # Almost all rotations are single-axis, where the Euler-to-quaternion
+        # conversion and the Hamilton product both collapse to closed forms
+        # with a fraction of the multiplies
+        if y == 0 and z == 0: return self.rx(x)
+        if x == 0 and z == 0: return self.ry(y)
+        if x == 0 and y == 0: return self.rz(z)
+        
+        cx, sx = _half_angle(x)
+        cy, sy = _half_angle(y)
+        cz, sz = _half_angle(z)
+        return self._compose_rotation(
+            sx*cy*cz - cx*sy*sz,
+            cx*sy*cz + sx*cy*sz,
+            cx*cy*sz - sx*sy*cz,
+            cx*cy*cz + sx*sy*sz,
+        )
+    
+    def rx(self, v: int | float) -> 'Node':
+        c, s = _half_angle(v)
+        x, y, z, w = self._rotation
+        return self._set_rotation(c*x + s*w, c*y - s*z, c*z + s*y, c*w - s*x)
+    
+    def ry(self, v: int | float) -> 'Node':
+        c, s = _half_angle(v)
+        x, y, z, w = self._rotation
+        return self._set_rotation(c*x + s*z, c*y + s*w, c*z - s*x, c*w - s*y)
+    
+    def rz(self, v: int | float) -> 'Node':
+        c, s = _half_angle(v)
+        x, y, z, w = self._rotation
+        return self._set_rotation(c*x - s*y, c*y + s*x, c*z + s*w, c*w - s*z)
+    
+    def _compose_rotation(self, x2, y2, z2, w2) -> 'Node':
+        # Full Hamilton product, only needed for true three-axis rotations
+        x1, y1, z1, w1 = self._rotation
+        return self._set_rotation(
+            w2*x1 + x2*w1 + y2*z1 - z2*y1,
+            w2*y1 - x2*z1 + y2*w1 + z2*x1,
+            w2*z1 + x2*y1 - y2*x1 + z2*w1,
+            w2*w1 - x2*x1 - y2*y1 - z2*z1,
+        )
+    
+    def _set_rotation(self, x, y, z, w) -> 'Node':
+        self._rotation = (x, y, z, w)
+        node_set_rotation(self._handle, x, y, z, w)
+        return self
 
 
 class Mesh:
+    __slots__ = ('_name', '_node', '_handle')
+    
     @property
     def name(self): return self._name
     @property
@@ -81,11 +348,72 @@ class Mesh:
 
 
 class PackedGeometry():
+    __slots__ = ('_handle',)
+    
     @property
     def handle(self): return self._handle
 
 
+# Fast path for the handful of colors models actually use. Values are
+# (r, g, b) - alpha intentionally left to the caller, same as the parser's
+# 3/6-digit path
+_COMMON_COLORS = {
+    '#000': (0.0, 0.0, 0.0),
+    '#f00': (1.0, 0.0, 0.0),
+    '#0f0': (0.0, 1.0, 0.0),
+    '#00f': (0.0, 0.0, 1.0),
+    '#ff0': (1.0, 1.0, 0.0),
+    '#0ff': (0.0, 1.0, 1.0),
+    '#f0f': (1.0, 0.0, 1.0),
+    '#fff': (1.0, 1.0, 1.0),
+}
+
+_color_cache = {}
+
+def _parse_color(color_string: str):
+    # Returns (r, g, b, a), with a == None when the string doesn't specify
+    # alpha. Memoized because interactive regeneration parses the same few
+    # strings over and over
+    result = _color_cache.get(color_string)
+    if result is None:
+        # One int() conversion of the whole hex string plus bit shifts,
+        # instead of one string slice + conversion per component
+        v = int(color_string[1:], 16)
+        if len(color_string) <= 5:
+            a = None
+            if len(color_string) == 5:
+                a = (v & 0xf)/0xf
+                v >>= 4
+            r = ((v >> 8) & 0xf)/0xf
+            g = ((v >> 4) & 0xf)/0xf
+            b = ( v       & 0xf)/0xf
+        else:
+            a = None
+            if len(color_string) == 9:
+                a = (v & 0xff)/0xff
+                v >>= 8
+            r = ((v >> 16) & 0xff)/0xff
+            g = ((v >>  8) & 0xff)/0xff
+            b = ( v        & 0xff)/0xff
+        
+        result = _color_cache[color_string] = (r, g, b, a)
+    return result
+
 class Material:
+    __slots__ = ('_name', '_r', '_g', '_b', '_a', '_metallicity',
+        '_roughness', '_handle')
+    
+    _cache = {}
+    
+    def get(*args, **kwargs) -> 'Material':
+        # Model generators tend to rebuild the same handful of colors on
+        # every call. Each construction allocates a fresh material handle on
+        # the Rust side, so repeated requests are served from a cache instead
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in Material._cache:
+            Material._cache[key] = Material(*args, **kwargs)
+        return Material._cache[key]
+    
     @property
     def name(self): return self._name
     @property
@@ -113,28 +441,28 @@ class Material:
         metallicity: float = 0.0,
         roughness: float = 1.0,
     ):
-        # Not a limitation of GLTF - this limitation is because of how I'm
-        # moving strings into the Rust area
-        assert len(name) <= 64
-        if color_string:
-            # Specifies RGB(A). Needed because I may add other formats in the
-            # future
-            assert color_string[0] == '#'
-            assert len(color_string) in [4, 5, 7, 9]
-        assert 0 <= metallicity <= 1
-        assert 0 <= roughness <= 1
+        # Precondition checks are grouped so python -O drops the whole
+        # block; production batch generation shouldn't pay for them
+        if __debug__:
+            # Not a limitation of GLTF - this limitation is because of how
+            # I'm moving strings into the Rust area
+            assert len(name) <= 64
+            if color_string:
+                # Specifies RGB(A). Needed because I may add other formats
+                # in the future
+                assert color_string[0] == '#'
+                assert len(color_string) in (4, 5, 7, 9)
+            assert 0 <= metallicity <= 1
+            assert 0 <= roughness <= 1
         
         self._name = name
         
-        if color_string:
-            step = 1 if len(color_string) <= 5 else 2
-            divisor = 0xf if step == 1 else 0xff
-            
-            r = int(color_string[1         :1 +   step], 16)/divisor
-            g = int(color_string[1 +   step:1 + 2*step], 16)/divisor
-            b = int(color_string[1 + 2*step:1 + 3*step], 16)/divisor
-            if len(color_string) == 1 + 4*step:
-                a = int(color_string[1+3*step:1+4*step], 16)/divisor
+        if color_string in _COMMON_COLORS:
+            r, g, b = _COMMON_COLORS[color_string]
+        elif color_string:
+            r, g, b, parsed_a = _parse_color(color_string)
+            if parsed_a is not None:
+                a = parsed_a
         
         self._r = r
         self._g = g
@@ -149,6 +477,13 @@ class Material:
 
 
 class Geometry:
+    __slots__ = ('_handle',)
+    
+    def New() -> 'Geometry':
+        result = Geometry()
+        result._handle = new_geometry()
+        return result
+    
     def Cube() -> 'Geometry':
         result = Geometry()
         result._handle = new_geometry_cube()
@@ -157,38 +492,174 @@ class Geometry:
     @property
     def handle(self): return self._handle
     
+    def clone(self) -> 'Geometry':
+        # Duplicates the geometry server-side, so a shared base shape can be
+        # built once and varied per copy instead of re-running its whole
+        # primitive sequence for each one
+        result = Geometry()
+        result._handle = geometry_clone(self._handle)
+        return result
+    
+    def create_vtcs(self, vtcs) -> 'Geometry':
+        # NumPy (N, 3) float64 arrays (and anything else with a .tobytes())
+        # pass straight through without building Python-level tuples
+        if hasattr(vtcs, 'tobytes'):
+            data = vtcs.tobytes()
+        else:
+            data = b''.join(_PACK_VERTEX(float(x), float(y), float(z))
+                for x, y, z in vtcs)
+        geometry_create_vertices(self._handle, data)
+        return self
+    
+    def create_tris(self, tris) -> 'Geometry':
+        # NumPy (N, 3) uint32 arrays (and anything else with a .tobytes())
+        # pass straight through without building Python-level tuples
+        if hasattr(tris, 'tobytes'):
+            data = tris.tobytes()
+        else:
+            data = b''.join(_PACK_TRIANGLE(a, b, c) for a, b, c in tris)
+        geometry_create_triangles(self._handle, data)
+        return self
+    
+    def add_cubes(self, params) -> 'Geometry':
+        # Each row is (sx, sy, sz, tx, ty, tz): a unit cube scaled and then
+        # translated. One FFI call emits all of them. NumPy (N, 6) float64
+        # arrays (and anything else with a .tobytes()) pass straight through
+        if hasattr(params, 'tobytes'):
+            data = params.tobytes()
+        else:
+            data = b''.join(_PACK_CUBE(*[float(v) for v in row])
+                for row in params)
+        geometry_add_cubes(self._handle, data)
+        return self
+    
     def t(self, x: int | float, y: int | float, z: int | float) -> 'Geometry':
         return self.translate(x, y, z)
     
     def translate(self, x: int | float, y: int | float, z: int | float,
     ) -> 'Geometry':
-        geometry_translate(self._handle, float(x), float(y), float(z))
+        geometry_translate(self._handle, x, y, z)
         return self
     
+    def tx(self, v: int | float) -> 'Geometry': return self.translate(v, 0, 0)
+    def ty(self, v: int | float) -> 'Geometry': return self.translate(0, v, 0)
+    def tz(self, v: int | float) -> 'Geometry': return self.translate(0, 0, v)
+    
     def s(self, x: int | float, y: int | float, z: int | float) -> 'Geometry':
         return self.scale(x, y, z)
     
+    def sx(self, v: int | float) -> 'Geometry': return self.scale(v, 1, 1)
+    def sy(self, v: int | float) -> 'Geometry': return self.scale(1, v, 1)
+    def sz(self, v: int | float) -> 'Geometry': return self.scale(1, 1, v)
+    
     def scale(self, x: int | float, y: int | float, z: int | float,
     ) -> 'Geometry':
-        geometry_scale(self._handle, float(x), float(y), float(z))
+        geometry_scale(self._handle, x, y, z)
+        return self
+    
+    def transform_szrt(self, sx: int | float, sy: int | float,
+    sz: int | float, lx: int | float, ly: int | float, lz: int | float,
+    angle: int | float, wx: int | float, wy: int | float, wz: int | float,
+    ) -> 'Geometry':
+        # Fused scale + local translate + Z rotation + world translate: one
+        # FFI call and one vertex pass instead of four of each
+        geometry_transform_szrt(self._handle, sx, sy, sz, lx, ly, lz,
+            angle, wx, wy, wz)
         return self
     
     def select_triangles(self, x1: int | float, y1: int | float,
     z1: int | float, x2: int | float, y2: int | float, z2: int | float):
-        geometry_select_triangles(self._handle, float(x1), float(y1), float(z1),
-            float(x2), float(y2), float(z2))
+        geometry_select_triangles(self._handle, x1, y1, z1, x2, y2, z2)
+        return self
+    
+    def replicate_linear(self, count: int, dx: int | float = 0,
+    dy: int | float = 0, dz: int | float = 0):
+        # One FFI call replaces a Python-side copy/translate loop
+        geometry_replicate_linear(self._handle, count, dx, dy, dz)
+        return self
+    
+    def replicate_symmetry_z(self, count: int):
+        # One FFI call replaces a Python-side copy/rotate loop; the native
+        # side reserves all the buffers up front
+        geometry_replicate_symmetry_z(self._handle, count)
+        return self
+    
+    def select_all(self):
+        # Equivalent to a select_triangles() call with bounds covering the
+        # whole geometry, but skips the per-vertex AABB scan
+        geometry_select_all(self._handle)
         return self
     
     def delete_triangles(self):
         geometry_delete_triangles(self._handle)
         return self
     
-    def pack(self) -> PackedGeometry:
+    def translate_many(moves):
+        # Applies many (geometry, x, y, z) translations in a single FFI
+        # crossing; each one folds into its target's pending transform
+        geometry_translate_many(b''.join(
+            _PACK_MOVE(geometry.handle, float(x), float(y), float(z))
+            for geometry, x, y, z in moves))
+    
+    def batch(self) -> 'GeometryBatch':
+        return GeometryBatch(self)
+    
+    def pack(self, optimize: bool = False) -> PackedGeometry:
+        # optimize=True runs a vertex-fetch remap (vertices reordered to
+        # first-reference order, unreferenced vertices dropped) before
+        # packing, for friendlier downstream rendering at no generator cost
+        if optimize:
+            geometry_optimize_vertex_fetch(self._handle)
         result = PackedGeometry()
         result._handle = geometry_pack(self._handle)
         return result
 
 
+
+class GeometryBatch:
+    # Records the mutation calls made on it and replays them on the Rust
+    # side in a single geometry_apply_ops() FFI crossing. Obtained from
+    # Geometry.batch(); ops are submitted when the with-block exits
+    __slots__ = ('_geometry', '_ops')
+    
+    def __init__(self, geometry: Geometry):
+        self._geometry = geometry
+        self._ops = bytearray()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self._ops:
+            geometry_apply_ops(self._geometry.handle, self._ops)
+        self._ops = bytearray()
+    
+    def _op(self, opcode: int, *args: float):
+        args += (0.0,)*(6 - len(args))
+        self._ops += _PACK_OP(opcode, *args)
+        return self
+    
+    def t(self, x, y, z): return self._op(1, float(x), float(y), float(z))
+    translate = t
+    
+    def s(self, x, y, z): return self._op(2, float(x), float(y), float(z))
+    scale = s
+    
+    def select_triangles(self, x1, y1, z1, x2, y2, z2):
+        return self._op(3, float(x1), float(y1), float(z1), float(x2),
+            float(y2), float(z2))
+    
+    def select_all(self): return self._op(4)
+    
+    def delete_triangles(self): return self._op(5)
+    
+    def replicate_linear(self, count: int, dx: int | float = 0,
+    dy: int | float = 0, dz: int | float = 0):
+        return self._op(7, float(count), float(dx), float(dy), float(dz))
+    
+    def replicate_symmetry_z(self, count: int):
+        return self._op(6, float(count))
+
 def read_string(handle: int) -> str:
     return str(wasm_call('string_transport', handle, -1), 'utf8')
 
@@ -196,50 +667,207 @@ def write_string(handle: int, string: str):
     if micropython:
         js.string_transport(handle, string)
     else:
-        raw_bytes = bytes(string, 'utf8')[:64]
+        raw_bytes = bytes(string, 'utf8')
         size = len(raw_bytes)
+        if size <= 8:
+            # Most names fit in 8 bytes; packed into two u32 arguments they
+            # ride along on the call itself, skipping the pointer round-trip
+            # and the ctypes.memmove
+            lo, hi = _UNPACK_SHORT_STRING(raw_bytes + b'\0'*(8 - size))
+            wasm_call_void('string_transport_set_short', handle, size, lo, hi)
+            return
+        if size > 64:
+            # Truncating mid-codepoint would make the wasm side's UTF-8
+            # validation reject the whole string; decode-with-ignore drops
+            # any split trailing sequence
+            raw_bytes = bytes(str(raw_bytes[:64], 'utf8', 'ignore'), 'utf8')
+            size = len(raw_bytes)
         
         dst_ptr = wasm_call('string_transport', handle, size)
-        ctypes.memmove(dst_ptr, raw_bytes, len(raw_bytes))
+        ctypes.memmove(dst_ptr, raw_bytes, size)
 
-def wasm_call(function: str, *args):
+def write_data(data):
+    # Accepts bytes, bytearray or memoryview; writable buffers are wrapped
+    # in place rather than copied to bytes first, so staging buffers (like
+    # GeometryBatch's op bytearray) can be reused across flushes
     if micropython:
-        # paraforge.wasm functions return i64...but micropython.wasm offers no
-        # means to transfer an i64 across it's FFI boundary. So the JS call
-        # actually returns an f64. All the paraforge.wasm functions called by
-        # this library return values low enough to fit in the 53 integer bits
-        # available in an f64
-        result = int(js.py_rust_call(function, *args))
+        js.data_transport(data)
+    else:
+        size = len(data)
+        dst_ptr = wasm_call('data_transport', size)
+        if not isinstance(data, bytes):
+            data = (ctypes.c_char*size).from_buffer(data)
+        ctypes.memmove(dst_ptr, data, size)
+
+# Result-decode masks, precomputed so the bytecode loads a name instead of
+# evaluating a power and so the big-int `% 2**64` normalization is replaced
+# by plain bit-ands (which also handle wasmtime's signed i64 returns)
+_LO32 = 0xffffffff
+
+def _wasm_call_void_micropython(function: str, *args):
+    # For exports that return nothing, success packs to exactly zero, so
+    # the tag/value decode in wasm_call can be skipped on the happy path
+    result = int(js.py_rust_call(function, *args))
+    
+    if result:
+        # Errors are rare; decode the same way wasm_call does
+        raise ParaforgeError(result & _LO32)
+
+def _wasm_call_void_wasmtime(function: str, *args):
+    # For exports that return nothing, success packs to exactly zero, so
+    # the tag/value decode in wasm_call can be skipped on the happy path
+    fn = _exports.get(function)
+    if fn is None:
+        if store is None: _load()
+        fn = _exports.setdefault(function,
+            _typed_caller(_instance_exports[function]))
+    result = fn(store, *args)
+    
+    if result:
+        # Errors are rare; decode the same way wasm_call does
+        raise ParaforgeError(result & _LO32)
+
+def _wasm_call_micropython(function: str, *args):
+    # paraforge.wasm functions return i64...but micropython.wasm offers no
+    # means to transfer an i64 across it's FFI boundary. So the JS call
+    # actually returns an f64. All the paraforge.wasm functions called by
+    # this library return values low enough to fit in the 53 integer bits
+    # available in an f64
+    result = int(js.py_rust_call(function, *args))
+    
+    # Success means tag == 0, i.e. the whole packed u64 fits in 32 bits, so
+    # the happy path is a single comparison with no shifts or masks
+    if 0 <= result < 0x1_0000_0000:
+        return result
+    
+    tag = (result >> 32) & _LO32
+    value = result & _LO32
+    
+    if tag < 2**16:
+        # Oh noes! A tag in this range must be an error code
+        raise ParaforgeError(value)
     else:
-        function = instance.exports(store)[function]
-        result = function(store, *args)
+        # Tags of 2^16 and higher are only used for returning fat pointers
+        # to WebAssembly memory areas. Under micropython, wasm memory is
+        # only reachable from the JS side (see string_transport /
+        # data_transport / serialize in micropython-reduced.js), so fat
+        # pointers can't be dereferenced here
+        raise NotImplementedError(f'{function}() returned a fat pointer, '
+            'which cannot be dereferenced under micropython - wasm memory '
+            'access must go through the JS transport functions')
+
+def _wasm_call_wasmtime(function: str, *args):
+    fn = _exports.get(function)
+    if fn is None:
+        if store is None: _load()
+        fn = _exports.setdefault(function,
+            _typed_caller(_instance_exports[function]))
+    result = fn(store, *args)
     
-    tag = (result % 2**64) >> 32
-    value = result & 0xffffffff
+    # Success means tag == 0, i.e. the whole packed u64 fits in 32 bits, so
+    # the happy path is a single comparison with no shifts or masks. The
+    # lower bound matters: wasmtime returns i64 results signed, and a fat
+    # pointer into high memory can come back negative
+    if 0 <= result < 0x1_0000_0000:
+        return result
+    
+    tag = (result >> 32) & _LO32
+    value = result & _LO32
     
-    if tag == 0:
-        # Success!
-        return value
-    elif tag < 2**16:
+    if tag < 2**16:
         # Oh noes! A tag in this range must be an error code
-        try:
-            raise ParaforgeError(ErrorCode(value))
-        except ValueError as e:
-            raise ParaforgeError(ErrorCode.UnrecognizedErrorCode) from e
+        raise ParaforgeError(value)
     else:
         # Tags of 2^16 and higher are only used for returning fat pointers
         # to WebAssembly memory areas
-        memory: wasmtime.Memory = instance.exports(store)['memory']
-        return memory.get_buffer_ptr(store, value, tag)
+        return _memory.get_buffer_ptr(store, value, tag)
+
+# The runtime is fixed at import, so bind the right body once instead of
+# re-testing `if micropython:` inside every call
+if micropython:
+    wasm_call_void = _wasm_call_void_micropython
+    wasm_call = _wasm_call_micropython
+else:
+    wasm_call_void = _wasm_call_void_wasmtime
+    wasm_call = _wasm_call_wasmtime
+
+def _void_thunk(function: str):
+    # Generates the module-level wrapper for a void export with the
+    # wasm_call_void logic inlined, so each call costs one Python frame
+    # instead of two. Only pass-through wrappers use this; wrappers that
+    # also stage transport data stay ordinary functions
+    if micropython:
+        def thunk(*args):
+            result = int(js.py_rust_call(function, *args))
+            if result:
+                raise ParaforgeError(result & _LO32)
+    else:
+        def thunk(*args):
+            fn = _exports.get(function)
+            if fn is None:
+                if store is None: _load()
+                fn = _exports.setdefault(function,
+                    _typed_caller(_instance_exports[function]))
+            result = fn(store, *args)
+            if result:
+                raise ParaforgeError(result & _LO32)
+    return thunk
 
 def init():
+    # The wasm side wipes its material table, so cached Material objects
+    # would hold handles into the discarded model
+    Material._cache.clear()
     return wasm_call('init')
 
 def serialize() -> bytes:
-    return bytes(wasm_call('serialize'))
+    result = wasm_call('serialize')
+    if micropython:
+        return bytes(result)
+    # ctypes.string_at is a single memcpy from wasm linear memory into the
+    # returned bytes object; bytes() on the ctypes array is much slower for
+    # multi-MB GLB buffers
+    return ctypes.string_at(result, len(result))
+
+def serialize_view() -> memoryview:
+    # Zero-copy variant for callers that immediately write the GLB to a
+    # file or socket. The view aliases wasm linear memory: it is only valid
+    # until the next wasm call, which may resize the serialization buffer
+    # or grow the memory
+    result = wasm_call('serialize')
+    if micropython:
+        return memoryview(bytes(result))
+    return memoryview(result)
+
+def serialize_into(buffer) -> int:
+    # serialize() is bandwidth-bound, not compute-bound: the work is moving
+    # the GLB blob out of wasm memory. This variant memcpys it into a
+    # caller-supplied writable buffer (bytearray, memoryview, numpy array)
+    # so a caller streaming repeated regenerations can reuse one allocation.
+    # Returns the number of bytes written
+    result = wasm_call('serialize')
+    size = len(result)
+    if micropython:
+        memoryview(buffer)[:size] = bytes(result)
+        return size
+    ctypes.memmove((ctypes.c_char*size).from_buffer(buffer), result, size)
+    return size
+
+def _short_name(name: str):
+    # Names of 8 UTF-8 bytes or fewer pack into two u32s and ride along on
+    # the create call itself, skipping the separate write_string crossing.
+    # Returns None when the name needs the regular transport path
+    if micropython: return None
+    raw_bytes = bytes(name, 'utf8')
+    size = len(raw_bytes)
+    if size > 8: return None
+    return (size,) + _UNPACK_SHORT_STRING(raw_bytes + b'\0'*(8 - size))
 
 def new_material(name: str, r: float, g: float, b: float, a: float,
 metallicity: float, roughness: float) -> int:
+    packed = _short_name(name)
+    if packed is not None:
+        return wasm_call('new_material_short', *packed, r, g, b, a,
+            metallicity, roughness)
     write_string(0, name)
     return wasm_call('new_material', r, g, b, a, metallicity, roughness)
 
@@ -248,29 +876,60 @@ def add_node_to_scene(scene: int, name: str) -> int:
     return wasm_call('add_node_to_scene', scene)
 
 def add_mesh_to_node(node: int, name: str) -> int:
+    packed = _short_name(name)
+    if packed is not None:
+        return wasm_call('add_mesh_to_node_short', node, *packed)
     write_string(0, name)
     return wasm_call('add_mesh_to_node', node)
 
+# (node, x, y, z) / (node, x, y, z, w)
+node_set_translation = _void_thunk('node_set_translation')
+node_set_rotation = _void_thunk('node_set_rotation')
+node_set_scale = _void_thunk('node_set_scale')
+
 def add_primitive_to_mesh(mesh: int, packed_geometry: int, material: int,
 ) -> int:
     return wasm_call('add_primitive_to_mesh', mesh, packed_geometry, material)
 
+def new_geometry() -> int:
+    return wasm_call('new_geometry')
+
 def new_geometry_cube() -> int:
     return wasm_call('new_geometry_cube')
 
-def geometry_translate(handle: int, x: float, y: float, z: float):
-    return wasm_call('geometry_translate', handle, x, y, z)
+def geometry_clone(handle: int) -> int:
+    return wasm_call('geometry_clone', handle)
+
+def geometry_create_vertices(handle: int, data: bytes):
+    write_data(data)
+    return wasm_call_void('geometry_create_vertices', handle, len(data)//24)
+
+def geometry_create_triangles(handle: int, data: bytes):
+    write_data(data)
+    return wasm_call_void('geometry_create_triangles', handle, len(data)//12)
+
+def geometry_add_cubes(handle: int, data: bytes):
+    write_data(data)
+    return wasm_call_void('geometry_add_cubes', handle, len(data)//48)
 
-def geometry_scale(handle: int, x: float, y: float, z: float):
-    return wasm_call('geometry_scale', handle, x, y, z)
+def geometry_translate_many(data: bytes):
+    write_data(data)
+    return wasm_call_void('geometry_translate_many', len(data)//32)
 
-def geometry_select_triangles(handle: int, x1: float, y1: float, z1: float,
-x2: float, y2: float, z2: float):
-    return wasm_call('geometry_select_triangles', handle, x1, y1, z1, x2, y2,
-        z2)
+# (handle, ...numeric arguments matching the wasm export)
+geometry_translate = _void_thunk('geometry_translate')
+geometry_scale = _void_thunk('geometry_scale')
+geometry_transform_szrt = _void_thunk('geometry_transform_szrt')
+geometry_select_triangles = _void_thunk('geometry_select_triangles')
+geometry_replicate_linear = _void_thunk('geometry_replicate_linear')
+geometry_replicate_symmetry_z = _void_thunk('geometry_replicate_symmetry_z')
+geometry_select_all = _void_thunk('geometry_select_all')
+geometry_optimize_vertex_fetch = _void_thunk('geometry_optimize_vertex_fetch')
+geometry_delete_triangles = _void_thunk('geometry_delete_triangles')
 
-def geometry_delete_triangles(handle: int):
-    return wasm_call('geometry_delete_triangles', handle)
+def geometry_apply_ops(handle: int, data: bytes):
+    write_data(data)
+    return wasm_call_void('geometry_apply_ops', handle, len(data)//56)
 
 def geometry_pack(handle: int) -> int:
     return wasm_call('geometry_pack', handle)
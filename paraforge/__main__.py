@@ -1,4 +1,4 @@
-import argparse, importlib, struct, json, sys
+import argparse, importlib, json, sys
 
 import paraforge
 
@@ -23,21 +23,31 @@ spec.loader.exec_module(script)
 
 paraforge.init()
 getattr(script, 'gen_' + args.generator)(*args.parameters)
-glb = paraforge.serialize()
-glb_length = struct.unpack('<L', glb[8:12])[0]
+# serialize_view() aliases wasm memory instead of copying the GLB out; no
+# further wasm calls happen below, so the view stays valid. Slicing a
+# memoryview is also zero-copy, unlike slicing bytes
+glb = paraforge.serialize_view()
+output_format = args.format.lower()
+
+if output_format == 'glb':
+    # GLB passes straight through - parsing the JSON chunk just to write
+    # the original bytes back out would be pure waste
+    sys.stdout.buffer.write(glb)
+    sys.exit(0)
+
+glb_length = int.from_bytes(glb[8:12], 'little')
 assert glb_length == len(glb)
-json_length = struct.unpack('<L', glb[12:16])[0]
-json_data = json.loads(glb[20:20 + json_length])
+json_length = int.from_bytes(glb[12:16], 'little')
+json_data = json.loads(bytes(glb[20:20 + json_length]))
 if glb_length > json_length + 20:
-    bin_length = struct.unpack('<L', glb[20 + json_length:24 + json_length])[0]
+    bin_length = int.from_bytes(glb[20 + json_length:24 + json_length],
+        'little')
     bin_data = glb[28 + json_length:]
     assert bin_length == len(bin_data)
 else:
     bin_data = None
 
-if args.format.lower() == 'pretty':
+if output_format == 'pretty':
     print(json.dumps(json_data, indent=2, sort_keys=True))
-elif args.format.lower() == 'gltf':
+elif output_format == 'gltf':
     raise NotImplementedError()
-elif args.format.lower() == 'glb':
-    sys.stdout.buffer.write(glb)
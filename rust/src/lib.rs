@@ -15,6 +15,7 @@ static GEOMETRIES: Mutex<Vec<Geometry>> = Mutex::new(Vec::new());
 static PACKED_GEOMETRIES: Mutex<Vec<PackedGeometry>> = Mutex::new(Vec::new());
 static STRING_TRANSPORT: Mutex<[Vec<u8>; 4]> = Mutex::new([vec![], vec![],
   vec![], vec![]]);
+static DATA_TRANSPORT: Mutex<Vec<u8>> = Mutex::new(Vec::new());
 static GLTF_SOURCE: Mutex<Option<GLTF>> = Mutex::new(None);
 static GLTF_OUTPUT: Mutex<Vec<u8>> = Mutex::new(Vec::new());
 
@@ -50,6 +51,58 @@ fn string_transport(handle: usize, size: usize) -> FFIResult<FatPointer> {
   return FatPointer::try_from(&string_transport[handle]);
 }
 
+// Fast path for strings of 8 bytes or fewer (most material/node/mesh
+// names): the bytes arrive packed in two u32 arguments, so the caller skips
+// the pointer round-trip and the host-side memory copy
+#[ffi]
+fn string_transport_set_short(handle: usize, size: u32, lo: u32, hi: u32,
+) -> FFIResult<()> {
+  let mut string_transport = lock(&STRING_TRANSPORT)?;
+  
+  if handle >= 4 { return Err(ErrorCode::HandleOutOfBounds) };
+  if size > 8 { return Err(ErrorCode::SizeOutOfBounds) };
+  
+  let mut bytes = [0; 8];
+  bytes[..4].copy_from_slice(&lo.to_le_bytes());
+  bytes[4..].copy_from_slice(&hi.to_le_bytes());
+  
+  string_transport[handle].clear();
+  string_transport[handle].extend_from_slice(&bytes[..size as usize]);
+  
+  Ok(())
+}
+
+// Fused create-with-short-name entry points: the name rides along packed in
+// two u32 arguments, so creating a named object is one crossing instead of
+// a string_transport write plus the create call
+
+#[ffi]
+fn new_material_short(size: u32, lo: u32, hi: u32, r: f64, g: f64, b: f64,
+a: f64, metallicity: f64, roughness: f64) -> FFIResult<usize> {
+  __string_transport_set_short(0, size, lo, hi)?;
+  return __new_material(r, g, b, a, metallicity, roughness);
+}
+
+#[ffi]
+fn add_mesh_to_node_short(node: usize, size: u32, lo: u32, hi: u32,
+) -> FFIResult<usize> {
+  __string_transport_set_short(0, size, lo, hi)?;
+  return __add_mesh_to_node(node);
+}
+
+// Like string_transport, but for bulk binary payloads (vertex/triangle
+// buffers), so there is no size cap and only one buffer
+#[ffi]
+fn data_transport(size: usize) -> FFIResult<FatPointer> {
+  let mut data_transport = lock(&DATA_TRANSPORT)?;
+  
+  if size != 0xffffffff {
+    data_transport.resize(size, 0);
+  }
+  
+  return FatPointer::try_from(&*data_transport);
+}
+
 ////////////////////
 // Error Handling //
 ////////////////////
@@ -145,44 +198,48 @@ pub struct Geometry {
   
   pub selection: Vec<u32>,
   pub selection_type: SelectionType,
+  
+  // Queued affine ops. Chains like .s(...).t(...) each used to cost a full
+  // vertex-buffer pass; they now compose here in O(1) and are applied in a
+  // single pass by flush_pending() when the vertices are next read
+  pub pending_scale: V3<f64>,
+  pub pending_translation: V3<f64>,
+  
+  // Handle of the PackedGeometry from the last .pack() call, cleared by any
+  // mutation, so repeated packs of an unchanged geometry are free. Selection
+  // changes don't clear it - they don't affect packed output
+  pub packed: Option<usize>,
 }
 
 impl Geometry {
-  /// Raw vertex byffer, suitable for GLTF packing
-  pub fn vertices_raw(&self) -> impl Iterator + '_ {
-    self.vertices.iter().flat_map(|v| vec![v[0] as f32, v[1] as f32,
-      v[2] as f32])
-  }
-  
-  /// Raw triangle byffer, suitable for GLTF packing
-  pub fn triangles_raw(&self) -> impl Iterator + '_ {
-    self.triangles.iter().flat_map(|v| {
-      if self.vertices.len() < 0x10000 {
-        return vec![
-          (v[0]     ) as u8,
-          (v[0] >> 8) as u8,
-          (v[1]     ) as u8,
-          (v[1] >> 8) as u8,
-          (v[2]     ) as u8,
-          (v[2] >> 8) as u8,
-        ]
-      } else {
-        return vec![
-          (v[0]      ) as u8,
-          (v[0] >>  8) as u8,
-          (v[0] >> 16) as u8,
-          (v[0] >> 24) as u8,
-          (v[1]      ) as u8,
-          (v[1] >>  8) as u8,
-          (v[1] >> 16) as u8,
-          (v[1] >> 24) as u8,
-          (v[2]      ) as u8,
-          (v[2] >>  8) as u8,
-          (v[2] >> 16) as u8,
-          (v[2] >> 24) as u8,
-        ]
+  /// Raw vertex byffer, suitable for GLTF packing. The f32 downcast happens
+  /// here, at the glTF boundary - the working store stays f64 so stacked
+  /// modeling transforms don't lose precision. Arrays instead of Vecs keep
+  /// this free of per-vertex heap allocations
+  pub fn vertices_raw(&self) -> impl Iterator<Item = f32> + '_ {
+    self.vertices.iter().flat_map(|v| [v[0] as f32, v[1] as f32, v[2] as f32])
+  }
+  
+  /// Raw triangle byffer, suitable for GLTF packing. Written into a single
+  /// pre-sized buffer rather than one Vec per triangle
+  pub fn triangles_raw(&self) -> Vec<u8> {
+    if self.vertices.len() < 0x10000 {
+      let mut result = Vec::with_capacity(6*self.triangles.len());
+      for v in &self.triangles {
+        result.extend_from_slice(&(v[0] as u16).to_le_bytes());
+        result.extend_from_slice(&(v[1] as u16).to_le_bytes());
+        result.extend_from_slice(&(v[2] as u16).to_le_bytes());
       }
-    })
+      result
+    } else {
+      let mut result = Vec::with_capacity(12*self.triangles.len());
+      for v in &self.triangles {
+        result.extend_from_slice(&v[0].to_le_bytes());
+        result.extend_from_slice(&v[1].to_le_bytes());
+        result.extend_from_slice(&v[2].to_le_bytes());
+      }
+      result
+    }
   }
   
   pub fn triangles_raw_component_type(&self) -> ComponentType {
@@ -193,50 +250,206 @@ impl Geometry {
     }
   }
   
-  // Apply a translation
-  pub fn t(&mut self, x: f64, y: f64, z: f64) -> &mut Self {
-    let translation = V3::new(x, y, z);
+  /// Applies any queued scale/translate in one pass over the vertex buffer
+  pub fn flush_pending(&mut self) {
+    if self.pending_scale == V3::new(1.0, 1.0, 1.0)
+      && self.pending_translation == V3::new(0.0, 0.0, 0.0) {
+      return;
+    }
+    
+    let scale = self.pending_scale;
+    let translation = self.pending_translation;
     
     for vertex in &mut self.vertices {
-      *vertex += translation;
+      *vertex = vertex.component_mul(&scale) + translation;
     }
     
+    self.pending_scale = V3::new(1.0, 1.0, 1.0);
+    self.pending_translation = V3::new(0.0, 0.0, 0.0);
+  }
+  
+  // Queue a translation
+  pub fn t(&mut self, x: f64, y: f64, z: f64) -> &mut Self {
+    self.packed = None;
+    
+    self.pending_translation += V3::new(x, y, z);
+    
     self
   }
   
-  // Apply a scale
+  // Queue a scale. Scaling after a queued translation also scales that
+  // translation, matching apply-immediately semantics
   pub fn s(&mut self, x: f64, y: f64, z: f64) -> &mut Self {
+    self.packed = None;
     let scale = V3::new(x, y, z);
     
-    for vertex in &mut self.vertices {
-      vertex.component_mul_assign(&scale);
-    }
+    self.pending_scale.component_mul_assign(&scale);
+    self.pending_translation.component_mul_assign(&scale);
     
     self
   }
   
   // rotations / matrices
   
+  /// Applies local scale, local translation, a Z-axis rotation, and a world
+  /// translation fused into one pass over the vertex buffer, instead of four
+  /// separate passes (and four boundary crossings) for the common
+  /// place-an-oriented-block sequence
+  pub fn transform_szrt(&mut self, scale: V3<f64>, local: V3<f64>, angle: f64,
+  world: V3<f64>) {
+    self.packed = None;
+    self.flush_pending();
+    
+    let (sin, cos) = angle.sin_cos();
+    
+    for vertex in &mut self.vertices {
+      let v = vertex.component_mul(&scale) + local;
+      *vertex = V3::new(
+        cos*v.x - sin*v.y + world.x,
+        sin*v.x + cos*v.y + world.y,
+        v.z + world.z,
+      );
+    }
+  }
+  
   // Merges
   
+  /// Remaps vertices into the order triangles first reference them, the
+  /// vertex-fetch half of a meshoptimizer-style pass. Downstream consumers
+  /// read the vertex buffer roughly in index order, so first-reference
+  /// ordering improves their cache locality; unreferenced vertices are
+  /// dropped along the way
+  pub fn optimize_vertex_fetch(&mut self) {
+    self.packed = None;
+    self.flush_pending();
+    
+    let mut remap = vec![u32::MAX; self.vertices.len()];
+    let mut next: u32 = 0;
+    
+    for triangle in &mut self.triangles {
+      for index in triangle.iter_mut() {
+        if remap[*index as usize] == u32::MAX {
+          remap[*index as usize] = next;
+          next += 1;
+        }
+        *index = remap[*index as usize];
+      }
+    }
+    
+    let mut vertices = vec![V3::new(0.0, 0.0, 0.0); next as usize];
+    for (old, &new) in remap.iter().enumerate() {
+      if new != u32::MAX {
+        vertices[new as usize] = self.vertices[old];
+      }
+    }
+    self.vertices = vertices;
+    
+    self.selection.drain(..);
+  }
+  
   // Vertex deduplication
   
+  /// Replaces the geometry with `count` copies of itself rotated evenly
+  /// about the Z axis (n-fold cylindrical symmetry). All copies are written
+  /// in one pass into buffers reserved up front
+  pub fn replicate_symmetry_z(&mut self, count: u32) {
+    self.packed = None;
+    self.flush_pending();
+    
+    let vertex_count = self.vertices.len();
+    let triangle_count = self.triangles.len();
+    
+    self.vertices.reserve_exact((count as usize - 1)*vertex_count);
+    self.triangles.reserve_exact((count as usize - 1)*triangle_count);
+    
+    for k in 1..count {
+      let angle = 2.0*std::f64::consts::PI*(k as f64)/(count as f64);
+      let (sin, cos) = angle.sin_cos();
+      
+      for i in 0..vertex_count {
+        let vertex = self.vertices[i];
+        self.vertices.push(V3::new(
+          cos*vertex.x - sin*vertex.y,
+          sin*vertex.x + cos*vertex.y,
+          vertex.z,
+        ));
+      }
+      
+      let offset = k*(vertex_count as u32);
+      for i in 0..triangle_count {
+        let triangle = self.triangles[i];
+        self.triangles.push([
+          triangle[0] + offset,
+          triangle[1] + offset,
+          triangle[2] + offset,
+        ]);
+      }
+    }
+    
+    self.selection.drain(..);
+  }
+  
+  /// Appends `count - 1` copies of the geometry, each offset by one more
+  /// multiple of the given delta (a linear array of copies)
+  pub fn replicate_linear(&mut self, count: u32, delta: V3<f64>) {
+    self.packed = None;
+    self.flush_pending();
+    
+    let vertex_count = self.vertices.len();
+    let triangle_count = self.triangles.len();
+    
+    self.vertices.reserve_exact((count as usize - 1)*vertex_count);
+    self.triangles.reserve_exact((count as usize - 1)*triangle_count);
+    
+    for k in 1..count {
+      let offset_spatial = delta*(k as f64);
+      
+      for i in 0..vertex_count {
+        self.vertices.push(self.vertices[i] + offset_spatial);
+      }
+      
+      let offset = k*(vertex_count as u32);
+      for i in 0..triangle_count {
+        let triangle = self.triangles[i];
+        self.triangles.push([
+          triangle[0] + offset,
+          triangle[1] + offset,
+          triangle[2] + offset,
+        ]);
+      }
+    }
+    
+    self.selection.drain(..);
+  }
+  
+  /// Selects every triangle. Faster than a select-everything AABB call
+  /// because it skips the per-vertex bounds scan entirely
+  pub fn select_all(&mut self) {
+    self.selection.drain(..);
+    self.selection_type = SelectionType::TRIANGLES;
+    
+    self.selection.extend(0..self.triangles.len() as u32);
+  }
+  
   /// Returns a list of vertices within the bounding box defined by the given
   /// points. Allows error of 1e-6
   pub fn select_vertices(&mut self, bound_1: V3<f64>, bound_2: V3<f64>) {
+    self.flush_pending();
+    
     self.selection.drain(..);
     self.selection_type = SelectionType::VERTICES;
     
     let lower_bound = bound_1.inf(&bound_2) - V3::new(1e-6, 1e-6, 1e-6);
     let upper_bound = bound_1.sup(&bound_2) + V3::new(1e-6, 1e-6, 1e-6);
     
-    for i in 0..self.vertices.len() {
-      if lower_bound[0] < self.vertices[i][0] &&
-         self.vertices[i][0] < upper_bound[0] &&
-         lower_bound[1] < self.vertices[i][1] &&
-         self.vertices[i][1] < upper_bound[1] &&
-         lower_bound[2] < self.vertices[i][2] &&
-         self.vertices[i][2] < upper_bound[2] {
+    for (i, vertex) in self.vertices.iter().enumerate() {
+      // Bitwise & instead of && so the six comparisons evaluate as
+      // branchless straight-line code instead of a chain of conditional
+      // jumps the branch predictor has to guess
+      let inside = (lower_bound[0] < vertex[0]) & (vertex[0] < upper_bound[0])
+                 & (lower_bound[1] < vertex[1]) & (vertex[1] < upper_bound[1])
+                 & (lower_bound[2] < vertex[2]) & (vertex[2] < upper_bound[2]);
+      if inside {
         self.selection.push(i as u32);
       }
     }
@@ -246,15 +459,20 @@ impl Geometry {
   /// points. Allows error of 1e-6
   pub fn select_triangles(&mut self, bound_1: V3<f64>, bound_2: V3<f64>) {
     self.select_vertices(bound_1, bound_2);
-    let bounded_vertices = self.selection.clone();
+    
+    // Membership mask makes the per-triangle test O(1) instead of a linear
+    // scan of the selected-vertex list for each corner
+    let mut bounded = vec![false; self.vertices.len()];
+    for &vertex in &self.selection {
+      bounded[vertex as usize] = true;
+    }
     
     self.selection.drain(..);
     self.selection_type = SelectionType::TRIANGLES;
     
-    for i in 0..self.triangles.len() {
-      if bounded_vertices.contains(&self.triangles[i][0]) &&
-         bounded_vertices.contains(&self.triangles[i][1]) &&
-         bounded_vertices.contains(&self.triangles[i][2]) {
+    for (i, triangle) in self.triangles.iter().enumerate() {
+      if bounded[triangle[0] as usize] & bounded[triangle[1] as usize]
+        & bounded[triangle[2] as usize] {
         self.selection.push(i as u32);
       }
     }
@@ -262,6 +480,8 @@ impl Geometry {
   
   /// Automatically deletes affected triangles
   pub fn delete_vertex(&mut self, vertex: u32) {
+    self.packed = None;
+    
     // Swap remove to avoid having to shift vertices
     self.vertices.swap_remove(vertex as usize);
     let swapped_vertex = self.vertices.len() as u32;
@@ -297,6 +517,8 @@ impl Geometry {
   }
   
   pub fn delete_triangle(&mut self, triangle: u32) {
+    self.packed = None;
+    
     self.triangles.swap_remove(triangle as usize);
     self.selection.drain(..);
   }
@@ -329,48 +551,85 @@ impl Geometry {
     }
   }
   
-  pub fn cube() -> Self {
+  pub fn new() -> Self {
     Self {
-      vertices: vec![
-        V3::new(-1.0,  1.0, -1.0),
-        V3::new(-1.0,  1.0,  1.0),
-        
-        V3::new(-1.0, -1.0, -1.0),
-        V3::new(-1.0, -1.0,  1.0),
-        
-        V3::new( 1.0,  1.0, -1.0),
-        V3::new( 1.0,  1.0,  1.0),
-        
-        V3::new( 1.0, -1.0, -1.0),
-        V3::new( 1.0, -1.0,  1.0),
-      ],
-      triangles: vec![
-        // Top
-        [1, 3, 5],
-        [3, 7, 5],
-        
-        // +X side
-        [4, 5, 6],
-        [5, 7, 6],
-        
-        // -X side
-        [0, 2, 1],
-        [1, 2, 3],
-        
-        // +Y side
-        [0, 1, 4],
-        [1, 5, 4],
-        
-        // -Y side
-        [2, 6, 3],
-        [3, 6, 7],
-        
-        // Bottom
-        [0, 4, 2],
-        [2, 4, 6],
-      ],
+      vertices: Vec::new(),
+      triangles: Vec::new(),
       selection: Vec::new(),
       selection_type: SelectionType::VERTICES,
+      pending_scale: V3::new(1.0, 1.0, 1.0),
+      pending_translation: V3::new(0.0, 0.0, 0.0),
+      packed: None,
+    }
+  }
+  
+  pub fn cube() -> Self {
+    let mut result = Self::new();
+    result.add_cube(V3::new(1.0, 1.0, 1.0), V3::new(0.0, 0.0, 0.0));
+    result
+  }
+  
+  /// Appends a unit cube scaled by `scale` and then moved by `translation`,
+  /// leaving any existing vertices/triangles in place
+  pub fn add_cube(&mut self, scale: V3<f64>, translation: V3<f64>) {
+    self.packed = None;
+    self.flush_pending();
+    
+    const CORNERS: [[f64; 3]; 8] = [
+      [-1.0,  1.0, -1.0],
+      [-1.0,  1.0,  1.0],
+      
+      [-1.0, -1.0, -1.0],
+      [-1.0, -1.0,  1.0],
+      
+      [ 1.0,  1.0, -1.0],
+      [ 1.0,  1.0,  1.0],
+      
+      [ 1.0, -1.0, -1.0],
+      [ 1.0, -1.0,  1.0],
+    ];
+    const TRIANGLES: [[u32; 3]; 12] = [
+      // Top
+      [1, 3, 5],
+      [3, 7, 5],
+      
+      // +X side
+      [4, 5, 6],
+      [5, 7, 6],
+      
+      // -X side
+      [0, 2, 1],
+      [1, 2, 3],
+      
+      // +Y side
+      [0, 1, 4],
+      [1, 5, 4],
+      
+      // -Y side
+      [2, 6, 3],
+      [3, 6, 7],
+      
+      // Bottom
+      [0, 4, 2],
+      [2, 4, 6],
+    ];
+    
+    let offset = self.vertices.len() as u32;
+    
+    for corner in CORNERS {
+      self.vertices.push(V3::new(
+        scale.x*corner[0] + translation.x,
+        scale.y*corner[1] + translation.y,
+        scale.z*corner[2] + translation.z,
+      ));
+    }
+    
+    for triangle in TRIANGLES {
+      self.triangles.push([
+        triangle[0] + offset,
+        triangle[1] + offset,
+        triangle[2] + offset,
+      ]);
     }
   }
   
@@ -1166,6 +1425,15 @@ impl Buffer {
 fn init() -> FFIResult<()> {
   let mut gltf_source = lock(&GLTF_SOURCE)?;
   *gltf_source = Some(GLTF::new());
+  
+  // Packed handles cache accessor indices into the GLTF that was just
+  // discarded, so any geometry that outlives the re-init must re-pack into
+  // the new one
+  let mut geometries = lock(&GEOMETRIES)?;
+  for geometry in geometries.iter_mut() {
+    geometry.packed = None;
+  }
+  
   return Ok(());
 }
 
@@ -1209,6 +1477,58 @@ fn add_node_to_scene(scene: usize) -> FFIResult<usize> {
   return Ok(gltf_source.nodes.len() - 1);
 }
 
+#[ffi]
+fn node_set_translation(node: usize, x: f64, y: f64, z: f64) -> FFIResult<()> {
+  // This lock must be saved in a variable before it can be used.
+  // (lock(&GLTF_SOURCE)?).as_ref()... does not compile. This snippet cannot be
+  // wrapped in a function
+  let mut gltf_source_option = lock(&GLTF_SOURCE)?;
+  let gltf_source = gltf_source_option.as_mut().ok_or(
+    ErrorCode::NotInitialized)?;
+  
+  if node >= gltf_source.nodes.len() {
+    return Err(ErrorCode::HandleOutOfBounds);
+  }
+  
+  gltf_source.nodes[node].t = Translation { x, y, z };
+  return Ok(());
+}
+
+#[ffi]
+fn node_set_rotation(node: usize, x: f64, y: f64, z: f64, w: f64)
+-> FFIResult<()> {
+  // This lock must be saved in a variable before it can be used.
+  // (lock(&GLTF_SOURCE)?).as_ref()... does not compile. This snippet cannot be
+  // wrapped in a function
+  let mut gltf_source_option = lock(&GLTF_SOURCE)?;
+  let gltf_source = gltf_source_option.as_mut().ok_or(
+    ErrorCode::NotInitialized)?;
+  
+  if node >= gltf_source.nodes.len() {
+    return Err(ErrorCode::HandleOutOfBounds);
+  }
+  
+  gltf_source.nodes[node].r = Rotation { x, y, z, w };
+  return Ok(());
+}
+
+#[ffi]
+fn node_set_scale(node: usize, x: f64, y: f64, z: f64) -> FFIResult<()> {
+  // This lock must be saved in a variable before it can be used.
+  // (lock(&GLTF_SOURCE)?).as_ref()... does not compile. This snippet cannot be
+  // wrapped in a function
+  let mut gltf_source_option = lock(&GLTF_SOURCE)?;
+  let gltf_source = gltf_source_option.as_mut().ok_or(
+    ErrorCode::NotInitialized)?;
+  
+  if node >= gltf_source.nodes.len() {
+    return Err(ErrorCode::HandleOutOfBounds);
+  }
+  
+  gltf_source.nodes[node].s = Scale { x, y, z };
+  return Ok(());
+}
+
 #[ffi]
 fn add_mesh_to_node(node: usize) -> FFIResult<usize> {
   let name = get_string_transport(0)?;
@@ -1266,6 +1586,113 @@ fn new_geometry_cube() -> FFIResult<usize> {
   return Ok(geometries.len() - 1);
 }
 
+#[ffi]
+fn new_geometry() -> FFIResult<usize> {
+  let mut geometries = lock(&GEOMETRIES)?;
+  geometries.push(Geometry::new());
+  return Ok(geometries.len() - 1);
+}
+
+#[ffi]
+fn geometry_clone(handle: usize) -> FFIResult<usize> {
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  // Selection state is deliberately not copied - clones exist to be varied
+  // independently. The packed handle is copied: until either copy mutates,
+  // both pack to the same buffers
+  let clone = Geometry {
+    vertices: geometries[handle].vertices.clone(),
+    triangles: geometries[handle].triangles.clone(),
+    selection: Vec::new(),
+    selection_type: SelectionType::VERTICES,
+    pending_scale: geometries[handle].pending_scale,
+    pending_translation: geometries[handle].pending_translation,
+    packed: geometries[handle].packed,
+  };
+  geometries.push(clone);
+  return Ok(geometries.len() - 1);
+}
+
+#[ffi]
+fn geometry_create_vertices(handle: usize, count: usize) -> FFIResult<()> {
+  let data_transport = lock(&DATA_TRANSPORT)?;
+  if data_transport.len() < 24*count {
+    return Err(ErrorCode::SizeOutOfBounds);
+  }
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].packed = None;
+  geometries[handle].flush_pending();
+  let vertices = &mut geometries[handle].vertices;
+  vertices.reserve_exact(count);
+  for vertex in data_transport[..24*count].chunks_exact(24) {
+    vertices.push(V3::new(
+      f64::from_le_bytes(vertex[ 0.. 8].try_into().unwrap()),
+      f64::from_le_bytes(vertex[ 8..16].try_into().unwrap()),
+      f64::from_le_bytes(vertex[16..24].try_into().unwrap()),
+    ));
+  }
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_create_triangles(handle: usize, count: usize) -> FFIResult<()> {
+  let data_transport = lock(&DATA_TRANSPORT)?;
+  if data_transport.len() < 12*count {
+    return Err(ErrorCode::SizeOutOfBounds);
+  }
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].packed = None;
+  let triangles = &mut geometries[handle].triangles;
+  triangles.reserve_exact(count);
+  for triangle in data_transport[..12*count].chunks_exact(12) {
+    triangles.push([
+      u32::from_le_bytes(triangle[0.. 4].try_into().unwrap()),
+      u32::from_le_bytes(triangle[4.. 8].try_into().unwrap()),
+      u32::from_le_bytes(triangle[8..12].try_into().unwrap()),
+    ]);
+  }
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_add_cubes(handle: usize, count: usize) -> FFIResult<()> {
+  let data_transport = lock(&DATA_TRANSPORT)?;
+  if data_transport.len() < 48*count {
+    return Err(ErrorCode::SizeOutOfBounds);
+  }
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  let geometry = &mut geometries[handle];
+  geometry.vertices.reserve_exact(8*count);
+  geometry.triangles.reserve_exact(12*count);
+  
+  // Each cube is [sx, sy, sz, tx, ty, tz] as packed little-endian f64s
+  for params in data_transport[..48*count].chunks_exact(48) {
+    let mut values = [0.0f64; 6];
+    for (i, value) in params.chunks_exact(8).enumerate() {
+      values[i] = f64::from_le_bytes(value.try_into().unwrap());
+    }
+    
+    geometry.add_cube(
+      V3::new(values[0], values[1], values[2]),
+      V3::new(values[3], values[4], values[5]),
+    );
+  }
+  
+  Ok(())
+}
+
 #[ffi]
 fn geometry_translate(handle: usize, x: f64, y: f64, z: f64) -> FFIResult<()> {
   let mut geometries = lock(&GEOMETRIES)?;
@@ -1286,6 +1713,45 @@ fn geometry_scale(handle: usize, x: f64, y: f64, z: f64) -> FFIResult<()> {
   Ok(())
 }
 
+// Bulk translate: one crossing applies a translation to many geometries.
+// Records are 32 bytes: u32 handle, 4 bytes padding, 3 little-endian f64s.
+// Each translation just folds into the target's pending transform, so the
+// whole batch is O(count)
+#[ffi]
+fn geometry_translate_many(count: usize) -> FFIResult<()> {
+  let data_transport = lock(&DATA_TRANSPORT)?;
+  if data_transport.len() < 32*count {
+    return Err(ErrorCode::SizeOutOfBounds);
+  }
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  
+  for record in data_transport[..32*count].chunks_exact(32) {
+    let handle = u32::from_le_bytes(record[0..4].try_into().unwrap()) as usize;
+    if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+    
+    geometries[handle].t(
+      f64::from_le_bytes(record[ 8..16].try_into().unwrap()),
+      f64::from_le_bytes(record[16..24].try_into().unwrap()),
+      f64::from_le_bytes(record[24..32].try_into().unwrap()),
+    );
+  }
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_transform_szrt(handle: usize, sx: f64, sy: f64, sz: f64, lx: f64,
+ly: f64, lz: f64, angle: f64, wx: f64, wy: f64, wz: f64) -> FFIResult<()> {
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].transform_szrt(V3::new(sx, sy, sz), V3::new(lx, ly, lz),
+    angle, V3::new(wx, wy, wz));
+  
+  Ok(())
+}
+
 #[ffi]
 fn geometry_select_triangles(handle: usize, x1: f64, y1: f64, z1: f64, x2: f64,
 y2: f64, z2: f64) -> FFIResult<()> {
@@ -1297,6 +1763,41 @@ y2: f64, z2: f64) -> FFIResult<()> {
   Ok(())
 }
 
+#[ffi]
+fn geometry_replicate_symmetry_z(handle: usize, count: u32) -> FFIResult<()> {
+  if count < 1 { return Err(ErrorCode::ParameterOutOfRange) };
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].replicate_symmetry_z(count);
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_replicate_linear(handle: usize, count: u32, dx: f64, dy: f64,
+dz: f64) -> FFIResult<()> {
+  if count < 1 { return Err(ErrorCode::ParameterOutOfRange) };
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].replicate_linear(count, V3::new(dx, dy, dz));
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_select_all(handle: usize) -> FFIResult<()> {
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].select_all();
+  
+  Ok(())
+}
+
 #[ffi]
 fn geometry_delete_triangles(handle: usize) -> FFIResult<()> {
   let mut geometries = lock(&GEOMETRIES)?;
@@ -1307,6 +1808,64 @@ fn geometry_delete_triangles(handle: usize) -> FFIResult<()> {
   Ok(())
 }
 
+#[ffi]
+fn geometry_apply_ops(handle: usize, count: usize) -> FFIResult<()> {
+  let data_transport = lock(&DATA_TRANSPORT)?;
+  if data_transport.len() < 56*count {
+    return Err(ErrorCode::SizeOutOfBounds);
+  }
+  
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  let geometry = &mut geometries[handle];
+  
+  // Each op is a fixed 56-byte record: u32 opcode, 4 bytes padding, then 6
+  // little-endian f64 arguments (unused arguments are zero)
+  for op in data_transport[..56*count].chunks_exact(56) {
+    let opcode = u32::from_le_bytes(op[0..4].try_into().unwrap());
+    let mut args = [0.0f64; 6];
+    for (i, arg) in op[8..56].chunks_exact(8).enumerate() {
+      args[i] = f64::from_le_bytes(arg.try_into().unwrap());
+    }
+    
+    match opcode {
+      1 => { geometry.t(args[0], args[1], args[2]); },
+      2 => { geometry.s(args[0], args[1], args[2]); },
+      3 => geometry.select_triangles(
+        V3::new(args[0], args[1], args[2]),
+        V3::new(args[3], args[4], args[5]),
+      ),
+      4 => geometry.select_all(),
+      5 => geometry.delete_triangles(),
+      // The replicate ops need the same count guard as their direct FFI
+      // entry points - count=0 would underflow inside the geometry methods
+      6 => {
+        if (args[0] as u32) < 1 { return Err(ErrorCode::ParameterOutOfRange) };
+        geometry.replicate_symmetry_z(args[0] as u32);
+      },
+      7 => {
+        if (args[0] as u32) < 1 { return Err(ErrorCode::ParameterOutOfRange) };
+        geometry.replicate_linear(args[0] as u32,
+          V3::new(args[1], args[2], args[3]));
+      },
+      _ => return Err(ErrorCode::ParameterOutOfRange),
+    }
+  }
+  
+  Ok(())
+}
+
+#[ffi]
+fn geometry_optimize_vertex_fetch(handle: usize) -> FFIResult<()> {
+  let mut geometries = lock(&GEOMETRIES)?;
+  if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  geometries[handle].optimize_vertex_fetch();
+  
+  Ok(())
+}
+
 #[ffi]
 fn geometry_pack(handle: usize) -> FFIResult<usize> {
   // This lock must be saved in a variable before it can be used.
@@ -1316,11 +1875,19 @@ fn geometry_pack(handle: usize) -> FFIResult<usize> {
   let mut gltf_source = gltf_source_option.as_mut().ok_or(
     ErrorCode::NotInitialized)?;
   
-  let geometries = lock(&GEOMETRIES)?;
+  let mut geometries = lock(&GEOMETRIES)?;
   if handle >= geometries.len() { return Err(ErrorCode::HandleOutOfBounds) };
+  
+  if let Some(packed) = geometries[handle].packed {
+    return Ok(packed);
+  }
+  
+  geometries[handle].flush_pending();
+  
   let mut packed_geometries = lock(&PACKED_GEOMETRIES)?;
   
   packed_geometries.push(geometries[handle].pack(&mut gltf_source));
+  geometries[handle].packed = Some(packed_geometries.len() - 1);
   return Ok(packed_geometries.len() - 1);
 }
 
@@ -1,26 +1,179 @@
-import os, subprocess
+import hashlib, importlib.util, json, mmap, os, struct, subprocess, sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
+import paraforge
+
+# Pre-compiled header formats: struct.unpack with a literal format re-parses
+# (or at best re-looks-up) the format string on every call
+_GLB_HEADER = struct.Struct('<4sLL')
+_PACK_VTX = struct.Struct('<3f').pack
+
+# Chunk headers are (u32 length, 4-byte type) = one little-endian u64 whose
+# high half is the type. Comparing against these packed constants skips
+# building a 4-byte bytes object per header on the happy path
+_TYPE_MASK = 0xffffffff << 32
+_JSON_TYPE_LE = int.from_bytes(b'JSON', 'little') << 32
+_BIN_TYPE_LE = int.from_bytes(b'BIN\x00', 'little') << 32
+
+def parse_glb(glb):
+    # Splits a .glb blob into its decoded JSON chunk and its BIN chunk
+    # (None when the blob has no BIN chunk). The BIN chunk comes back as a
+    # zero-copy memoryview into the caller's blob; the JSON chunk has to be
+    # materialized because json.loads() rejects memoryviews
+    glb = memoryview(glb)
+    magic, version, length = _GLB_HEADER.unpack_from(glb, 0)
+    assert magic == b'glTF'
+    assert version == 2
+    assert length == len(glb)
+
+    json_header = int.from_bytes(glb[12:20], 'little')
+    json_length = json_header & 0xffffffff
+    if json_header & _TYPE_MASK != _JSON_TYPE_LE:
+        # Diagnostics live on the failure path only - an assert message
+        # with a computed hint would scan the buffer on every success too
+        raise AssertionError(f'First .glb chunk must have type JSON but '
+            f'got {bytes(glb[16:20])}')
+    json_data = json.loads(bytes(glb[20:20 + json_length]))
+
+    bin_data = None
+    if length > 20 + json_length:
+        bin_header = int.from_bytes(glb[20 + json_length:28 + json_length],
+            'little')
+        bin_length = bin_header & 0xffffffff
+        if bin_header & _TYPE_MASK != _BIN_TYPE_LE:
+            hint = ''
+            idx = bytes(glb).find(b'BIN\x00')
+            if idx != -1:
+                hint = f' (possible BIN chunk header at byte {idx - 4})'
+            raise AssertionError(f'Second .glb chunk must have type '
+                f'BIN\\x00 but got '
+                f'{bytes(glb[24 + json_length:28 + json_length])}{hint}')
+        bin_data = glb[28 + json_length:]
+        assert bin_length == len(bin_data)
+
+    return json_data, bin_data
+
+def parse_glb_strict(glb):
+    # parse_glb plus the structural rules the fast path takes on faith:
+    # 4-byte alignment of the blob and both chunks, and space-only JSON
+    # padding per the glTF spec. Only worth running when a mismatch
+    # needs diagnosing
+    glb = memoryview(glb)
+    json_data, bin_data = parse_glb(glb)
+
+    length = int.from_bytes(glb[8:12], 'little')
+    json_length = int.from_bytes(glb[12:16], 'little')
+    if length % 4:
+        raise AssertionError(f'.glb length {length} is not 4-byte aligned')
+    if json_length % 4:
+        raise AssertionError(f'JSON chunk length {json_length} is not '
+            '4-byte aligned')
+
+    json_chunk = bytes(glb[20:20 + json_length])
+    if json_chunk.rstrip() != json_chunk.rstrip(b' '):
+        raise AssertionError('JSON chunk padding must be 0x20 spaces')
+
+    if bin_data is not None and len(bin_data) % 4:
+        raise AssertionError(f'BIN chunk length {len(bin_data)} is not '
+            '4-byte aligned')
+
+    return json_data, bin_data
+
 ####################
 # Setup / Teardown #
 ####################
 
 def setup_module():
-    os.mkdir(Path(__file__).parent / 'test-temp')
-    os.chdir(Path(__file__).parent / 'test-temp')
-    os.symlink('../paraforge', 'paraforge')
+    # Tests run paraforge in-process, so the interpreter, wasmtime, and the
+    # compiled wasm module are all paid for once per session instead of
+    # once per test. paraforge.init() gives each test a fresh model
+    os.chdir(Path(__file__).parent)
+    sys.path.insert(0, str(Path(__file__).parent))
+
+@pytest.fixture(scope='session')
+def expected_glb():
+    # Read and parse the reference .glb once per session instead of once
+    # per test. Session fixtures run before setup_module's chdir, so the
+    # path is anchored to this file
+    data = (Path(__file__).parent / 'test-files/first_model.glb').read_bytes()
+    digest = hashlib.blake2b(data, digest_size=32).digest()
+    return (data, *parse_glb(data), digest)
+
+@pytest.fixture(autouse=True)
+def _paraforge_init():
+    # Every in-process test wants a fresh model, and init() is cheap once
+    # the wasm module is loaded, so reset unconditionally per test
+    paraforge.init()
 
 #########
 # Tests #
 #########
 
-def test_demo():
-    result = subprocess.run([
-        'python', '-m', 'paraforge', '../examples/first_model.pf.py',
-        'first_model',
-    ], capture_output=True)
-    
-    assert result.returncode == 0
-    
-    with open('../test-files/first_model.glb', 'rb') as f:
-        assert result.stdout == f.read()
+def test_demo(expected_glb):
+    spec = importlib.util.spec_from_file_location('script',
+        'examples/first_model.pf.py')
+    script = importlib.util.module_from_spec(spec)
+    sys.modules['script'] = script
+    spec.loader.exec_module(script)
+
+    script.gen_first_model()
+    glb = paraforge.serialize()
+
+    _, json_expected, bin_expected, expected_digest = expected_glb
+
+    # Fast path: the whole-blob digest compare settles the common case in
+    # one hash. Chunk-level parsing only runs on mismatch, where a JSON
+    # or BIN diff is far more readable than a raw byte mismatch
+    if hashlib.blake2b(glb, digest_size=32).digest() == expected_digest:
+        return
+
+    json_actual, bin_actual = parse_glb_strict(glb)
+    assert json_actual == json_expected
+    assert bin_actual == bin_expected
+    pytest.fail('glb differs from expected, but both chunks compare '
+        'equal - likely a header or padding difference')
+
+def test_bulk_vtcs():
+    # N plain-Python vertex triples pushed through the bulk create_vtcs
+    # path, packed and serialized once, then read back out of the BIN
+    # chunk. Values are chosen to be exactly representable as f32 so the
+    # f64 -> f32 downcast during packing is lossless
+    n = 256
+    vtcs = [(float(i), (i % 7) / 8, (i % 3) - 1.0) for i in range(n)]
+    tris = [(i, i + 1, i + 2) for i in range(n - 2)]
+
+    geometry = paraforge.Geometry.New().create_vtcs(vtcs).create_tris(tris)
+    material = paraforge.Material('Bulk', '#888')
+    node = paraforge.Node('Bulk Vertices')
+    node.add_mesh('Bulk Vertices').add_primitive(geometry.pack(), material)
+
+    _, bin_ = parse_glb(paraforge.serialize())
+    expected = b''.join(_PACK_VTX(*v) for v in vtcs)
+    assert bytes(bin_[:len(expected)]) == expected
+
+def test_cli_smoke(expected_glb):
+    # One subprocess-based test keeps the CLI path (argument parsing,
+    # stdout plumbing) covered now that test_demo runs in-process
+    # stdout goes to a temp file instead of a pipe: the child writes the
+    # glb in one shot with no pipe backpressure, and mmap lets the
+    # comparison read it without another userspace copy
+    with tempfile.TemporaryFile() as tf:
+        result = subprocess.run([sys.executable, '-m', 'paraforge',
+            'examples/first_model.pf.py', 'first_model'], stdout=tf,
+            stderr=subprocess.PIPE)
+        assert result.returncode == 0, result.stderr.decode()
+        with mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+            # memoryview equality is a C-level memcmp and keeps pytest
+            # from repring two whole glb buffers; the byte-at-a-time
+            # offset scan only ever runs on failure
+            expected = expected_glb[0]
+            if view != expected:
+                limit = min(len(view), len(expected))
+                offset = next((i for i in range(limit)
+                    if view[i] != expected[i]), limit)
+                pytest.fail(f'glb differs at byte {offset} (actual '
+                    f'{len(view)} bytes, expected {len(expected)})')